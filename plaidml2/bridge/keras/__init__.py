@@ -5,11 +5,8 @@ import inspect
 import logging
 import math
 import os
-from collections import defaultdict
 from contextlib import contextmanager
 
-import six
-
 import numpy as np
 import scipy.stats
 import plaidml2 as plaidml
@@ -24,24 +21,30 @@ logger = logging.getLogger(__name__)
 
 # Keras needs us to keep track of unique IDs for prefix strings
 # (for use with get_uid and reset_uids)
-_UID_PREFIX_DICT = defaultdict(int)
+_UID_PREFIX_DICT = {}
 
 _NAME_SCOPE_STACK = []
 
+# The '/'-joined prefix for each level of _NAME_SCOPE_STACK (including the empty outermost scope)
+_NAME_SCOPE_PREFIXES = ['']
+
 _CONV_DATA_FORMAT = ['channels_first', 'channels_last']
 
 _in_train_phase = None  # Will be initialized on first use
 
 _device = plaidml_settings.get('PLAIDML_DEVICE')
 
+# DType conversions only depend on their (hashable) argument, so memoize them
+_dtype_from_numpy = functools.lru_cache(maxsize=64)(plaidml.DType.from_numpy)
+_dtype_into_numpy = functools.lru_cache(maxsize=64)(plaidml.DType.into_numpy)
+
 
 def _prepend_name_scope(name, default):
+    prefix = _NAME_SCOPE_PREFIXES[-1]
     if name:
-        r = '/'.join(_NAME_SCOPE_STACK + [name])
-    else:
-        r = '/'.join(_NAME_SCOPE_STACK + [default])
-        r += '/' + str(get_uid(r))
-    return r
+        return prefix + name
+    r = prefix + default
+    return r + '/' + str(get_uid(r))
 
 
 def _normalize_axis(axis, ndims, name=''):
@@ -55,6 +58,12 @@ def _normalize_axis(axis, ndims, name=''):
     return normalized_axis
 
 
+@functools.lru_cache(maxsize=256)
+def _normalize_axes(ndims, axes, name=''):
+    # `axes` must be hashable (i.e. a tuple); the result is sorted and free of duplicates
+    return tuple(sorted(set(_normalize_axis(axis, ndims, name) for axis in axes)))
+
+
 def _normalize_data_format(data_format):
     if data_format is None:
         data_format = image_data_format()
@@ -76,31 +85,34 @@ def _normalize_padding(padding):
 
 
 def _log_call(func):
-    '''A decorator that logs the call of the wrapped function'''
-
-    def wrapper(*args, **kwargs):
-        # Call the requested function regardless
-        return func(*args, **kwargs)
-
-    return wrapper
+    '''A decorator marking a backend entry point whose calls may be logged'''
+    # No call logging is currently performed, so hand back the function itself rather than
+    # adding a pass-through wrapper frame to every backend op dispatch.
+    return func
 
 
 class _Executable(object):
 
     def __init__(self, name, inputs, outputs, updates):
-        self._inputs = inputs
         self.program = edsl.Program(name, outputs, updates=updates)
         self.binder = plaidml_exec.Binder(self.program)
         self.executable = self.binder.compile()
+        # Resolve the bound buffers (and their numpy dtypes) once, rather than on every call.
+        self._input_buffers = []
+        for tensor in inputs:
+            buffer = self.binder.input(tensor)
+            dtype = _dtype_into_numpy(buffer.shape.dtype) if buffer else None
+            self._input_buffers.append((buffer, dtype))
+        self._output_buffers = [self.binder.output(x.ref) for x in self.program.outputs]
 
     def __call__(self, inputs):
-        for tensor, data in zip(self._inputs, inputs):
-            buffer = self.binder.input(tensor)
+        for (buffer, dtype), data in zip(self._input_buffers, inputs):
             if buffer:
-                data = np.array(data, dtype=buffer.shape.dtype.into_numpy())
-                buffer.copy_from_ndarray(data)
+                buffer.copy_from_ndarray(np.asarray(data, dtype=dtype))
         self.executable.run()
-        return [self.binder.output(x.ref).as_ndarray() for x in self.program.outputs]
+        # Each output Buffer owns a single ndarray that is refreshed in place on every run;
+        # callers must copy any result that needs to outlive the next call.
+        return [x.as_ndarray() for x in self._output_buffers]
 
 
 class _Function(object):
@@ -110,31 +122,38 @@ class _Function(object):
         self._inputs = inputs
         self._outputs = outputs
         self._updates = updates
+        # Placeholder dtypes are fixed, so resolve them once rather than on every compile
+        self._input_dtypes = [x.tensor.shape.dtype for x in inputs]
         self._cache = {}
+        # The most recently used entry of _cache; repeated calls (e.g. successive batches in a
+        # training loop) usually have the same input shapes, so check it before the dict lookup.
+        self._last_shapes = None
+        self._last_exe = None
 
     def __call__(self, inputs):
-        inputs = [np.array(x) if isinstance(x, (six.integer_types, float)) else x for x in inputs]
-        input_shapes = tuple([x.shape for x in inputs])
+        inputs = [np.array(x) if isinstance(x, (int, float)) else x for x in inputs]
+        input_shapes = tuple(x.shape for x in inputs)
+        if input_shapes == self._last_shapes:
+            return self._last_exe(inputs)
         logger.debug('_Function: {}({})'.format(self._name, input_shapes))
         exe = self._cache.get(input_shapes)
         if not exe:
             exe = self._compile(inputs)
             self._cache[input_shapes] = exe
+        self._last_shapes = input_shapes
+        self._last_exe = exe
         return exe(inputs)
 
     def _compile(self, inputs):
-        for node, data in zip(self._inputs, inputs):
-            dtype = node.tensor.shape.dtype
-            shape = edsl.LogicalShape(dtype, data.shape)
-            node.tensor.bind(shape)
-        inputs = [x.tensor for x in self._inputs]
+        tensors = [x.tensor for x in self._inputs]
+        edsl.bind_shapes(tensors, self._input_dtypes, [x.shape for x in inputs])
         outputs = [x.tensor for x in self._outputs]
         updates = [(x[0].tensor, x[1].tensor) for x in self._updates]
-        return _Executable(self._name, inputs, outputs, updates)
+        return _Executable(self._name, tensors, outputs, updates)
 
 
 def _create_var(name, value):
-    dtype = plaidml.DType.from_numpy(value.dtype)
+    dtype = _dtype_from_numpy(value.dtype)
     shape = edsl.LogicalShape(dtype, value.shape)
     tensor_shape = plaidml.TensorShape(dtype, value.shape)
     buffer = plaidml.Buffer(tensor_shape, device=_device)
@@ -142,7 +161,31 @@ def _create_var(name, value):
     return edsl.Tensor(shape=shape, name=name, buffer=buffer)
 
 
+# Single-element fill values for ones_like/zeros_like, keyed by (name, value, dtype)
+_FILL_VARS = {}
+
+
+def _fill_var(name, value, dtype):
+    key = (name, value, dtype)
+    var = _FILL_VARS.get(key)
+    if var is None:
+        var = _create_var(name, np.full((1), value, dtype=dtype))
+        _FILL_VARS[key] = var
+    return var
+
+
+def _unwrap_operand(x):
+    if isinstance(x, _KerasNode):
+        return x.tensor
+    if isinstance(x, np.ndarray):
+        return variable(x).tensor
+    return x
+
+
 class _KerasNode(object):
+    # Keras attaches its own bookkeeping attributes (e.g. _keras_history) to some nodes, so keep
+    # a __dict__ for those; it is only allocated for nodes that actually receive one.
+    __slots__ = ('opname', 'name', 'tensor', '__dict__', '__weakref__')
 
     def __init__(self, opname, name=None, shape=None, tensor=None, value=None):
         self.opname = opname
@@ -180,8 +223,7 @@ class _KerasNode(object):
         raw_tensor_dims = getattr(self, '_RawTensorDims', None)
         if raw_tensor_dims is not None:
             raw_tensor_dims = raw_tensor_dims[key]
-        if isinstance(key, slice) or isinstance(key, six.integer_types) or isinstance(
-                key, type(Ellipsis)):
+        if isinstance(key, (slice, int, type(Ellipsis))):
             key = (key,)
         if not isinstance(key, tuple):
             raise ValueError('Cannot index PlaidML tensors using type {}'.format(type(key)))
@@ -215,67 +257,54 @@ class _KerasNode(object):
         return _KerasNode('neg', tensor=-self.tensor)
 
     def __add__(self, other):
-        return self.__binary_op('add', other, lambda x, y: x + y)
+        return _KerasNode('add', tensor=self.tensor + _unwrap_operand(other))
 
     def __radd__(self, other):
-        return self.__binary_op('add', other, lambda x, y: y + x)
+        return _KerasNode('add', tensor=_unwrap_operand(other) + self.tensor)
 
     def __sub__(self, other):
-        return self.__binary_op('sub', other, lambda x, y: x - y)
+        return _KerasNode('sub', tensor=self.tensor - _unwrap_operand(other))
 
     def __rsub__(self, other):
-        return self.__binary_op('sub', other, lambda x, y: y - x)
+        return _KerasNode('sub', tensor=_unwrap_operand(other) - self.tensor)
 
     def __mul__(self, other):
-        return self.__binary_op('mul', other, lambda x, y: x * y)
+        return _KerasNode('mul', tensor=self.tensor * _unwrap_operand(other))
 
     def __rmul__(self, other):
-        return self.__binary_op('mul', other, lambda x, y: y * x)
-
-    def __div__(self, other):
-        return self.__binary_op('div', other, lambda x, y: x / y)
-
-    def __rdiv__(self, other):
-        return self.__binary_op('div', other, lambda x, y: y / x)
+        return _KerasNode('mul', tensor=_unwrap_operand(other) * self.tensor)
 
     def __truediv__(self, other):
-        return self.__binary_op('div', other, lambda x, y: x / y)
+        return _KerasNode('div', tensor=self.tensor / _unwrap_operand(other))
 
     def __rtruediv__(self, other):
-        return self.__binary_op('div', other, lambda x, y: y / x)
+        return _KerasNode('div', tensor=_unwrap_operand(other) / self.tensor)
 
     def __ge__(self, other):
-        return self.__binary_op('cmp_ge', other, lambda x, y: x >= y)
+        return _KerasNode('cmp_ge', tensor=self.tensor >= _unwrap_operand(other))
 
     def __gt__(self, other):
-        return self.__binary_op('cmp_gt', other, lambda x, y: x > y)
+        return _KerasNode('cmp_gt', tensor=self.tensor > _unwrap_operand(other))
 
     def __le__(self, other):
-        return self.__binary_op('cmp_le', other, lambda x, y: x <= y)
+        return _KerasNode('cmp_le', tensor=self.tensor <= _unwrap_operand(other))
 
     def __lt__(self, other):
-        return self.__binary_op('cmp_lt', other, lambda x, y: x < y)
-
-    def __binary_op(self, op, other, fn):
-        logger.debug('{}(self: {}, other: {})'.format(op, self, other))
-        if isinstance(other, _KerasNode):
-            other = other.tensor
-        if isinstance(other, np.ndarray):
-            other = variable(other).tensor
-        return _KerasNode(op, tensor=fn(self.tensor, other))
+        return _KerasNode('cmp_lt', tensor=self.tensor < _unwrap_operand(other))
 
 
 _k_rng_size = 2048
 
+# Lower bounds for each row of the initial RNG state
+_k_rng_min = np.array([[1], [7], [15]], dtype=np.uint32)
+
 
 def _make_rng_state(seed=None):
     if seed:
         np.random.seed(seed)
 
-    rng_init = np.empty((3, _k_rng_size), dtype=np.uint32)
-    rng_init[0] = np.random.randint(1, 2**32, (_k_rng_size,), dtype=np.uint32)
-    rng_init[1] = np.random.randint(7, 2**32, (_k_rng_size,), dtype=np.uint32)
-    rng_init[2] = np.random.randint(15, 2**32, (_k_rng_size,), dtype=np.uint32)
+    rng_init = np.random.randint(1, 2**32, (3, _k_rng_size), dtype=np.uint32)
+    np.maximum(rng_init, _k_rng_min, out=rng_init)
     rng_state = variable(rng_init, dtype='uint32')
 
     return rng_state
@@ -311,7 +340,7 @@ def any(x, axis=None, keepdims=False):
 @_log_call
 def arange(start, stop=None, step=1, dtype='int32'):
     if isinstance(dtype, plaidml.DType):
-        dtype = dtype.into_numpy()
+        dtype = _dtype_into_numpy(dtype)
     return variable(np.arange(start, stop, step, dtype), dtype=dtype)
 
 
@@ -334,7 +363,7 @@ def backend():
 def batch_dot(x, y, axes=None, name=None):
     X = x.tensor
     Y = y.tensor
-    if isinstance(axes, six.integer_types):
+    if isinstance(axes, int):
         axes = (axes, axes)
     if axes is None:
         axes = (X.shape.ndims - 1, Y.shape.ndims - 2)
@@ -459,9 +488,9 @@ def cast(x, dtype):
     # x = ptile.Value.from_python_value(x)
 
     try:
-        dtype = plaidml.DType.from_numpy(dtype)
+        dtype = _dtype_from_numpy(dtype)
     except ValueError:
-        raise PlaidMLKerasException('Unsupported cast (%s -> %s)' % (x.shape.dtype, dtype))
+        raise PlaidMLKerasException('Unsupported cast (%s -> %s)' % (x.tensor.shape.dtype, dtype))
 
     if x.tensor.shape.dtype == dtype:
         return x
@@ -502,6 +531,7 @@ def ceil(x):
 def clear_session():
     global _in_train_phase
     _in_train_phase = None
+    _FILL_VARS.clear()
 
 
 @_log_call
@@ -523,11 +553,13 @@ def constant(value, dtype=None, shape=None, name=None):
     if shape is None:
         if isinstance(value, np.ndarray):
             shape = value.shape
-        elif isinstance(value, list) or isinstance(value, tuple):
+        elif isinstance(value, (list, tuple)):
             shape = (len(value),)
         else:
             shape = (1,)
-    np_value = np.full(shape, value, dtype=dtype or floatx())
+    # A read-only broadcast view is sufficient here: the data is only copied into the device
+    # buffer, so there's no need to materialize the full array on the host first.
+    np_value = np.broadcast_to(np.asarray(value, dtype=dtype or floatx()), shape)
     return _KerasNode('constant', name=name, value=np_value)
 
 
@@ -625,9 +657,9 @@ def conv1d(x, kernel, strides=1, padding='valid', data_format=None, dilation_rat
 
 @_log_call
 def conv2d(x, kernel, strides=(1, 1), padding='valid', dilation_rate=(1, 1), data_format=None):
-    if isinstance(strides, six.integer_types):
+    if isinstance(strides, int):
         strides = (strides,) * 2
-    if isinstance(dilation_rate, six.integer_types):
+    if isinstance(dilation_rate, int):
         dilation_rate = (dilation_rate,) * 2
     return conv(x, kernel, strides, padding, data_format, dilation_rate)
 
@@ -640,9 +672,9 @@ def conv2d_transpose(x,
                      padding='valid',
                      data_format=None,
                      dilation_rate=(1, 1)):
-    if isinstance(strides, six.integer_types):
+    if isinstance(strides, int):
         strides = (strides,) * 2
-    if isinstance(dilation_rate, six.integer_types):
+    if isinstance(dilation_rate, int):
         dilation_rate = (dilation_rate,) * 2
     return conv_transpose(x, kernel, output_shape, strides, padding, data_format, dilation_rate)
 
@@ -654,9 +686,9 @@ def conv3d(x,
            padding='valid',
            dilation_rate=(1, 1, 1),
            data_format=None):
-    if isinstance(strides, six.integer_types):
+    if isinstance(strides, int):
         strides = (strides,) * 3
-    if isinstance(dilation_rate, six.integer_types):
+    if isinstance(dilation_rate, int):
         dilation_rate = (dilation_rate,) * 3
     return conv(x, kernel, strides, padding, data_format, dilation_rate)
 
@@ -669,9 +701,9 @@ def conv3d_transpose(x,
                      padding='valid',
                      data_format=None,
                      dilation_rate=(1, 1, 1)):
-    if isinstance(strides, six.integer_types):
+    if isinstance(strides, int):
         strides = (strides,) * 3
-    if isinstance(dilation_rate, six.integer_types):
+    if isinstance(dilation_rate, int):
         dilation_rate = (dilation_rate,) * 3
     return conv_transpose(x, kernel, output_shape, strides, padding, data_format, dilation_rate)
 
@@ -751,7 +783,7 @@ def dropout(x, level, noise_shape=None, seed=None):
 
 @_log_call
 def dtype(x):
-    return x.tensor.shape.dtype.into_numpy()
+    return _dtype_into_numpy(x.tensor.shape.dtype)
 
 
 @_log_call
@@ -761,15 +793,7 @@ def elu(x, alpha=1.0):
 
 @_log_call
 def equal(x, y):
-    if isinstance(x, _KerasNode):
-        x = x.tensor
-    if isinstance(x, np.ndarray):
-        x = variable(x).tensor
-    if isinstance(y, _KerasNode):
-        y = y.tensor
-    if isinstance(y, np.ndarray):
-        y = variable(y).tensor
-    return _KerasNode('equal', tensor=(x == y))
+    return _KerasNode('equal', tensor=(_unwrap_operand(x) == _unwrap_operand(y)))
 
 
 @_log_call
@@ -792,7 +816,7 @@ def eye(size, dtype=None, name=None):
     if dtype is None:
         dtype = floatx()
     elif isinstance(dtype, plaidml.DType):
-        dtype = dtype.into_numpy()
+        dtype = _dtype_into_numpy(dtype)
     return variable(np.eye(size, dtype=dtype), name=name, dtype=dtype)
 
 
@@ -847,8 +871,9 @@ def gather(x, indicies):
 
 @_log_call
 def get_uid(prefix=''):
-    _UID_PREFIX_DICT[prefix] += 1
-    return _UID_PREFIX_DICT[prefix]
+    uid = _UID_PREFIX_DICT.get(prefix, 0) + 1
+    _UID_PREFIX_DICT[prefix] = uid
+    return uid
 
 
 @_log_call
@@ -1045,8 +1070,10 @@ def moving_average_update(x, value, momentum):
 @contextmanager
 def name_scope(name):
     _NAME_SCOPE_STACK.append(name)
+    _NAME_SCOPE_PREFIXES.append(_NAME_SCOPE_PREFIXES[-1] + name + '/')
     logger.debug('name_scope({}), push: {}'.format(name, _NAME_SCOPE_STACK))
     yield
+    _NAME_SCOPE_PREFIXES.pop()
     _NAME_SCOPE_STACK.pop()
     logger.debug('name_scope({}), pop: {}'.format(name, _NAME_SCOPE_STACK))
 
@@ -1058,15 +1085,7 @@ def ndim(x):
 
 @_log_call
 def not_equal(lhs, rhs):
-    if isinstance(lhs, _KerasNode):
-        lhs = lhs.tensor
-    if isinstance(lhs, np.ndarray):
-        lhs = variable(lhs).tensor
-    if isinstance(rhs, _KerasNode):
-        rhs = rhs.tensor
-    if isinstance(rhs, np.ndarray):
-        rhs = variable(rhs).tensor
-    return _KerasNode('not_equal', tensor=(lhs != rhs))
+    return _KerasNode('not_equal', tensor=(_unwrap_operand(lhs) != _unwrap_operand(rhs)))
 
 
 @_log_call
@@ -1074,10 +1093,10 @@ def normalize_batch_in_training(x, gamma, beta, reduction_axes, epsilon=1e-3):
     I = x.tensor
     ndims = I.shape.ndims
     if reduction_axes == None:
-        raw_axes = [ndims - 1]
+        raw_axes = (ndims - 1,)
     else:
-        raw_axes = reduction_axes
-    axes = [_normalize_axis(x, ndims, 'normalize_batch_in_training') for x in raw_axes]
+        raw_axes = tuple(reduction_axes)
+    axes = _normalize_axes(ndims, raw_axes, 'normalize_batch_in_training')
     m = mean(x, axis=axes, keepdims=True)
     v = var(x, axis=axes, keepdims=True)
 
@@ -1132,8 +1151,7 @@ def ones(shape, dtype=None, name=None):
 
 @_log_call
 def ones_like(x, dtype=None, name=None):
-    value = np.full((1), 1, dtype=dtype or floatx())
-    one = _create_var('a_one', value)
+    one = _fill_var('a_one', 1, dtype or floatx())
     I = x.tensor
     ndim = I.shape.ndims
     dims = edsl.TensorDims(ndim)
@@ -1151,7 +1169,7 @@ def permute_dimensions(x, pattern=None):
 
 @_log_call
 def placeholder(shape=None, ndim=None, dtype=None, sparse=False, name=None):
-    dtype = plaidml.DType.from_numpy(dtype or floatx())
+    dtype = _dtype_from_numpy(dtype or floatx())
     # TODO: Need to support empty shapes; once supported, convert below to `if _ is not None`
     if shape is not None:
         return _KerasNode('placeholder', shape=edsl.LogicalShape(dtype, shape), name=name)
@@ -1255,7 +1273,7 @@ def random_uniform(shape, minval=0.0, maxval=1.0, dtype=None, seed=None):
     R = edsl.prng(rng_state.tensor, shape)
     dtype = dtype or floatx()
     if dtype != 'float32':
-        R = edsl.cast(R, plaidml.DType.from_numpy(dtype))
+        R = edsl.cast(R, _dtype_from_numpy(dtype))
     O = (maxval - minval) * R + minval
     return _KerasNode('random_uniform', tensor=O)
 
@@ -1358,7 +1376,7 @@ def rnn(step_function,
         input_length=None):
     if input_length is None:
         input_length = inputs.tensor.shape.int_dims[1]
-    if not isinstance(input_length, six.integer_types):
+    if not isinstance(input_length, int):
         raise NotImplementedError('rnn is not implemented for variable sized inputs')
     if mask is not None:
         raise NotImplementedError('rnn is not implemented with mask support')
@@ -1480,7 +1498,7 @@ def set_learning_phase(value):
 
 @_log_call
 def set_value(x, value):
-    dtype = plaidml.DType.from_numpy(value.dtype)
+    dtype = _dtype_from_numpy(value.dtype)
     tensor_shape = plaidml.TensorShape(dtype, value.shape)
     buffer = plaidml.Buffer(tensor_shape, device=_device)
     buffer.copy_from_ndarray(value)
@@ -1686,9 +1704,7 @@ def variable(value, dtype=None, name=None, constraint=None):
     dtype = dtype or floatx()
     if isinstance(value, _KerasNode):
         value = value.eval()
-    if isinstance(value, float) or isinstance(value, six.integer_types):
-        value = np.array(value, dtype=dtype)
-    if isinstance(value, list) or isinstance(value, tuple):
+    if isinstance(value, (float, int, list, tuple)):
         value = np.array(value, dtype=dtype)
     if isinstance(value, np.ndarray):
         if dtype != value.dtype:
@@ -1708,8 +1724,7 @@ def zeros(shape, dtype=None, name=None):
 
 @_log_call
 def zeros_like(x, dtype=None, name=None):
-    value = np.full((1), 0, dtype=dtype or floatx())
-    zero = _create_var('a_zero', value)
+    zero = _fill_var('a_zero', 0, dtype or floatx())
     I = x.tensor
     ndim = I.shape.ndims
     dims = edsl.TensorDims(ndim)
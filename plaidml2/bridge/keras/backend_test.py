@@ -1618,6 +1618,8 @@ class TestBackendOps(unittest.TestCase):
     @opTest([
         [m(3, 2, 4), [1, 7, 3]],
         [m(2, 3, 1), [2, 1, 4]],
+        [m(2, 3, 4), [1, 1, 2]],
+        [m(3, 2, 4), [1, 1, 1]],
     ])
     def testTile(self, b, x, n):
         return [b.tile(x, n)]
@@ -11,7 +11,6 @@ REQUIRED_PACKAGES = [
     'numpy',
     'plaidml2',
     'scipy',
-    'six',
 ]
 
 
@@ -34,7 +33,6 @@ def main():
             'Operating System :: Microsoft :: Windows :: Windows 10',
             'Operating System :: POSIX :: Linux',
             'Programming Language :: C++',
-            'Programming Language :: Python :: 2.7',
             'Programming Language :: Python :: 3.7',
             'Topic :: Scientific/Engineering',
             'Topic :: Scientific/Engineering :: Mathematics',
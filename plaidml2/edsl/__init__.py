@@ -564,11 +564,15 @@ def TensorOutput(*args):
 
 
 def TensorDims(count):
-    return [TensorDim() for i in range(count)]
+    raw_dims = ffi.new('plaidml_dim_expr*[]', count)
+    ffi_call(lib.plaidml_dim_expr_nones, count, raw_dims)
+    return [TensorDim(expr=raw_dims[i]) for i in range(count)]
 
 
 def TensorIndexes(count):
-    return [TensorIndex() for i in range(count)]
+    raw_idxs = ffi.new('plaidml_poly_expr*[]', count)
+    ffi_call(lib.plaidml_poly_expr_indexes, count, raw_idxs)
+    return [TensorIndex(expr=raw_idxs[i]) for i in range(count)]
 
 
 class ProgramArgument:
@@ -618,6 +622,21 @@ class Program(ForeignObject):
         return [x for x in self.args if not x.is_input]
 
 
+def bind_shapes(tensors, dtypes, shapes):
+    """Binds concrete shapes to a list of placeholder tensors using a single foreign call.
+
+    Args:
+        tensors (list): The placeholder Tensors to bind.
+        dtypes (list): The DType to bind to each tensor.
+        shapes (list): The dimensions (a sequence of ints) to bind to each tensor.
+
+    """
+    raw_exprs = [x.as_ptr() for x in tensors]
+    raw_ndims = [len(x) for x in shapes]
+    raw_dims = ffi.new('int64_t[]', [0 if x is None else x for shape in shapes for x in shape])
+    ffi_call(lib.plaidml_expr_bind_shapes, len(raw_exprs), raw_exprs, dtypes, raw_ndims, raw_dims)
+
+
 def wrap_tensor(x):
     if isinstance(x, six.integer_types):
         return Tensor(expr=ffi_call(lib.plaidml_expr_int, x))
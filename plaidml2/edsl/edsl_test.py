@@ -1375,6 +1375,28 @@ function (
         self.assertEqual(outputs[0].tolist(), [1, 2, 3])
         self.assertEqual(outputs[1].tolist(), [1, 2, 3])
 
+    def test_bind_shapes(self):
+        A = Tensor(LogicalShape(plaidml.DType.INT32, [0, 0]))
+        B = Tensor(LogicalShape(plaidml.DType.INT32, []))
+        C = Tensor(LogicalShape(plaidml.DType.FLOAT32, [0, 0, 0]))
+        D = Tensor(LogicalShape(plaidml.DType.UINT8, [0]))
+        bind_shapes(
+            [A, B, C, D],
+            [
+                plaidml.DType.FLOAT32, plaidml.DType.INT32, plaidml.DType.FLOAT16,
+                plaidml.DType.UINT8
+            ],
+            [(2, 3), (), (4, 5, 6), (7,)],
+        )
+        self.assertEqual(A.shape.dtype, plaidml.DType.FLOAT32)
+        self.assertEqual(A.shape.int_dims, [2, 3])
+        self.assertEqual(B.shape.dtype, plaidml.DType.INT32)
+        self.assertEqual(B.shape.int_dims, [])
+        self.assertEqual(C.shape.dtype, plaidml.DType.FLOAT16)
+        self.assertEqual(C.shape.int_dims, [4, 5, 6])
+        self.assertEqual(D.shape.dtype, plaidml.DType.UINT8)
+        self.assertEqual(D.shape.int_dims, [7])
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -400,6 +400,39 @@ void plaidml_expr_bind_shape(  //
   });
 }
 
+void plaidml_expr_bind_shapes(       //
+    plaidml_error* err,              //
+    size_t nexprs,                   //
+    plaidml_expr** exprs,            //
+    const plaidml_datatype* dtypes,  //
+    const size_t* ndims,             //
+    const int64_t* dims) {
+  return ffi_wrap_void(err, [&] {
+    IVLOG(3, "plaidml_expr_bind_shapes> nexprs: " << nexprs);
+    for (size_t i = 0; i < nexprs; i++) {
+#ifdef PLAIDML_AST
+      auto param_expr = std::dynamic_pointer_cast<ParamExpr>(exprs[i]->expr);
+      if (!param_expr) {
+        throw std::runtime_error("Shape binding is only supported on ParamExprs");
+      }
+      LogicalShape shape;
+      shape.dtype = static_cast<DataType>(dtypes[i]);
+      for (size_t j = 0; j < ndims[i]; j++) {
+        auto int_expr = std::make_shared<DimIntExpr>(dims[j]);
+        shape.dims.emplace_back(LogicalDim{int_expr});
+      }
+      param_expr->shape = shape;
+#endif
+#ifdef PLAIDML_MLIR
+      llvm::SmallVector<int64_t, 6> dimsVec(dims, dims + ndims[i]);
+      auto type = GlobalContext::get()->MakeRankedTensorType(static_cast<DataType>(dtypes[i]), dimsVec);
+      GlobalContext::get()->BindShape(exprs[i]->value, type);
+#endif
+      dims += ndims[i];
+    }
+  });
+}
+
 void plaidml_expr_bind_dims(  //
     plaidml_error* err,       //
     plaidml_expr* expr,       //
@@ -1023,6 +1056,23 @@ plaidml_poly_expr* plaidml_poly_expr_index(  //
   });
 }
 
+void plaidml_poly_expr_indexes(  //
+    plaidml_error* err,          //
+    size_t nidxs,                //
+    plaidml_poly_expr** idxs) {
+  return ffi_wrap_void(err, [&] {
+    IVLOG(3, "plaidml_poly_expr_indexes> nidxs: " << nidxs);
+    for (size_t i = 0; i < nidxs; i++) {
+#ifdef PLAIDML_AST
+      idxs[i] = new plaidml_poly_expr{std::make_shared<PolyIndex>(next_idx_id++, std::string{})};
+#endif
+#ifdef PLAIDML_MLIR
+      idxs[i] = new plaidml_poly_expr{GlobalContext::get()->MakeAffineIndexOp("")};
+#endif
+    }
+  });
+}
+
 plaidml_poly_expr* plaidml_poly_expr_literal(  //
     plaidml_error* err,                        //
     int64_t value) {
@@ -1104,6 +1154,23 @@ plaidml_dim_expr* plaidml_dim_expr_none(  //
   });
 }
 
+void plaidml_dim_expr_nones(  //
+    plaidml_error* err,       //
+    size_t ndims,             //
+    plaidml_dim_expr** dims) {
+  return ffi_wrap_void(err, [&] {
+    IVLOG(3, "plaidml_dim_expr_nones> ndims: " << ndims);
+    for (size_t i = 0; i < ndims; i++) {
+#ifdef PLAIDML_AST
+      dims[i] = new plaidml_dim_expr{std::make_shared<DimNoneExpr>()};
+#endif
+#ifdef PLAIDML_MLIR
+      dims[i] = new plaidml_dim_expr{GlobalContext::get()->MakeNoneOp()};
+#endif
+    }
+  });
+}
+
 plaidml_dim_expr* plaidml_dim_expr_int(  //
     plaidml_error* err,                  //
     int64_t value) {
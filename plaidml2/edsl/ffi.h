@@ -90,6 +90,12 @@ plaidml_poly_expr* plaidml_poly_expr_index(  //
     plaidml_error* err,                      //
     const char* name);
 
+// Allocates `nidxs` new unnamed indexes into `idxs`.
+void plaidml_poly_expr_indexes(  //
+    plaidml_error* err,          //
+    size_t nidxs,                //
+    plaidml_poly_expr** idxs);
+
 plaidml_poly_expr* plaidml_poly_expr_literal(  //
     plaidml_error* err,                        //
     int64_t value);
@@ -116,6 +122,12 @@ plaidml_dim_expr* plaidml_dim_expr_none(  //
     plaidml_error* err                    //
 );
 
+// Allocates `ndims` new unbound dims into `dims`.
+void plaidml_dim_expr_nones(  //
+    plaidml_error* err,       //
+    size_t ndims,             //
+    plaidml_dim_expr** dims);
+
 plaidml_dim_expr* plaidml_dim_expr_int(  //
     plaidml_error* err,                  //
     int64_t value);
@@ -182,6 +194,16 @@ void plaidml_expr_bind_dims(  //
     size_t ndims,             //
     plaidml_dim_expr** dims);
 
+// Binds a concrete shape to each of `nexprs` exprs in a single call.
+// The dims for all exprs are concatenated into `dims`; `ndims[i]` is the rank of the i'th expr.
+void plaidml_expr_bind_shapes(       //
+    plaidml_error* err,              //
+    size_t nexprs,                   //
+    plaidml_expr** exprs,            //
+    const plaidml_datatype* dtypes,  //
+    const size_t* ndims,             //
+    const int64_t* dims);
+
 plaidml_string* plaidml_expr_repr(  //
     plaidml_error* err,             //
     plaidml_expr* expr);
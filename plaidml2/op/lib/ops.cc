@@ -1697,12 +1697,22 @@ Value mean(const Value& value) {
   AggregationAxes agg(I_shape.ndims(), axes, keepdims);
 
   I.bind_dims(agg.src_dims);
-  auto SO = TensorOutput(agg.dst_dims);
-  SO(agg.dst_idxs) += I(agg.src_idxs);
   auto denom = Tensor{1};
   for (const auto& axis : agg.axes) {
     denom = denom * agg.src_dims.at(axis);
   }
+  auto SO = TensorOutput(agg.dst_dims);
+  auto dtype = I_shape.dtype();
+  // BFLOAT16 takes the unfused path: the scale has to be cast to the input dtype, and cast has no
+  // bfloat16 lowering.
+  if (dtype == PLAIDML_DATA_FLOAT16 || dtype == PLAIDML_DATA_FLOAT32 || dtype == PLAIDML_DATA_FLOAT64) {
+    // Fold the normalization into the contraction as a scalar factor, so the mean is a single
+    // op rather than a sum followed by an eltwise divide over the reduced tensor.
+    auto scale = cast(Tensor{1.0} / denom, dtype);
+    SO(agg.dst_idxs) += I(agg.src_idxs) * scale();
+    return Value{SO};
+  }
+  SO(agg.dst_idxs) += I(agg.src_idxs);
   return Value{SO / denom};
 }
 
@@ -2630,14 +2640,25 @@ Value tile(const Value& value) {
     throw std::runtime_error("More tiling factors provided to tile operation than tensor dimensions");
   }
 
+  if (std::all_of(reps.begin(), reps.end(), [](int64_t rep) { return rep == 1; })) {
+    // Tiling by 1 along every axis is the identity
+    return Value{I};
+  }
+
   std::vector<TensorDim> I_dims(ndims);
   std::vector<TensorIndex> I_idxs(ndims);
   I.bind_dims(I_dims);
   std::vector<TensorDim> O_dims;
   std::vector<TensorIndex> O_idxs;
   for (size_t i = 0; i < ndims; ++i) {
-    O_dims.push_back(I_dims[i] * reps[i]);
-    O_idxs.push_back(TensorIndex() * I_dims[i] + I_idxs[i]);
+    if (reps[i] == 1) {
+      // Axes that aren't replicated map straight through, without any index arithmetic
+      O_dims.push_back(I_dims[i]);
+      O_idxs.push_back(I_idxs[i]);
+    } else {
+      O_dims.push_back(I_dims[i] * reps[i]);
+      O_idxs.push_back(TensorIndex() * I_dims[i] + I_idxs[i]);
+    }
   }
   auto O = TensorOutput(O_dims);
   O(O_idxs) = I(I_idxs);
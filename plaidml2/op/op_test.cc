@@ -750,11 +750,12 @@ TEST(Op, Mean) {
   EXPECT_THAT(program, Eq(R"(function (
   A[A_0, A_1]
 ) -> (
-  _X2
+  _X3
 ) {
-  _X0[] = +(A[x0, x1]);
-  _X1 = 200;
-  _X2 = div(_X0, _X1);
+  _X0 = 0.005000;
+  _X1 = 32;
+  _X2 = as_float(_X0, _X1);
+  _X3[] = +(A[x0, x1] * _X2[]);
 }
 )"));
 #endif
@@ -764,14 +765,13 @@ TEST(Op, Mean) {
 #map1 = (d0, d1) -> (d0, d1)
 
 
-!i32 = type tensor<!eltwise.i32>
 !fp32 = type tensor<!eltwise.fp32>
 module {
   func @mean(%arg0: tensor<10x20x!eltwise.fp32> {tile.name = "A"}) -> !fp32 {
-    %c200 = "eltwise.sconst"() {value = 200 : index} : () -> !i32
-    %cst = "eltwise.sconst"() {value = 0.000000e+00 : f64} : () -> !fp32
-    %0 = tile.cion add, none, %cst, %arg0 {sink = #map0, srcs = [#map1]} : !fp32, tensor<10x20x!eltwise.fp32> -> !fp32
-    %1 = "eltwise.div"(%0, %c200) {type = !eltwise.fp32} : (!fp32, !i32) -> !fp32
+    %cst = "eltwise.sconst"() {value = 5.000000e-03 : f64} : () -> !fp32
+    %cst_0 = "eltwise.sconst"() {value = 0.000000e+00 : f64} : () -> !fp32
+    %0 = "eltwise.cast"(%cst) : (!fp32) -> !fp32
+    %1 = tile.cion add, mul, %cst_0, %arg0, %0 {sink = #map0, srcs = [#map1, #map0]} : !fp32, tensor<10x20x!eltwise.fp32>, !fp32 -> !fp32
     return %1 : !fp32
   }
 }
@@ -1491,17 +1491,18 @@ TEST(Op, Variance) {
   EXPECT_THAT(program, Eq(R"(function (
   A[A_0, A_1]
 ) -> (
-  _X8
+  _X9
 ) {
-  _X0[x2, x3 : 1, 1] = +(A[x0, x1]);
-  _X1 = 200;
-  _X2 = div(_X0, _X1);
-  _X3 = sub(A, _X2);
-  _X4 = sub(A, _X2);
-  _X5 = mul(_X3, _X4);
-  _X6[] = +(_X5[x0, x1]);
-  _X7 = 200;
-  _X8 = div(_X6, _X7);
+  _X0 = 0.005000;
+  _X1 = 32;
+  _X2 = as_float(_X0, _X1);
+  _X3[x2, x3 : 1, 1] = +(A[x0, x1] * _X2[]);
+  _X4 = sub(A, _X3);
+  _X5 = sub(A, _X3);
+  _X6 = mul(_X4, _X5);
+  _X7[] = +(_X6[x0, x1]);
+  _X8 = 200;
+  _X9 = div(_X7, _X8);
 }
 )"));
 #endif
@@ -1518,12 +1519,13 @@ TEST(Op, Variance) {
 module {
   func @variance(%arg0: tensor<10x20x!eltwise.fp32> {tile.name = "A"}) -> !fp32 {
     %c200 = "eltwise.sconst"() {value = 200 : index} : () -> !i32
-    %cst = "eltwise.sconst"() {value = 0.000000e+00 : f64} : () -> !fp32
-    %0 = tile.cion add, none, %cst, %arg0 {sink = #map0, srcs = [#map1]} : !fp32, tensor<10x20x!eltwise.fp32> -> tensor<1x1x!eltwise.fp32>
-    %1 = "eltwise.div"(%0, %c200) {type = !eltwise.fp32} : (tensor<1x1x!eltwise.fp32>, !i32) -> tensor<1x1x!eltwise.fp32>
+    %cst = "eltwise.sconst"() {value = 5.000000e-03 : f64} : () -> !fp32
+    %cst_0 = "eltwise.sconst"() {value = 0.000000e+00 : f64} : () -> !fp32
+    %0 = "eltwise.cast"(%cst) : (!fp32) -> !fp32
+    %1 = tile.cion add, mul, %cst_0, %arg0, %0 {sink = #map0, srcs = [#map1, #map2]} : !fp32, tensor<10x20x!eltwise.fp32>, !fp32 -> tensor<1x1x!eltwise.fp32>
     %2 = "eltwise.sub"(%arg0, %1) {type = !eltwise.fp32} : (tensor<10x20x!eltwise.fp32>, tensor<1x1x!eltwise.fp32>) -> tensor<10x20x!eltwise.fp32>
     %3 = "eltwise.mul"(%2, %2) {type = !eltwise.fp32} : (tensor<10x20x!eltwise.fp32>, tensor<10x20x!eltwise.fp32>) -> tensor<10x20x!eltwise.fp32>
-    %4 = tile.cion add, none, %cst, %3 {sink = #map2, srcs = [#map3]} : !fp32, tensor<10x20x!eltwise.fp32> -> !fp32
+    %4 = tile.cion add, none, %cst_0, %3 {sink = #map2, srcs = [#map3]} : !fp32, tensor<10x20x!eltwise.fp32> -> !fp32
     %5 = "eltwise.div"(%4, %c200) {type = !eltwise.fp32} : (!fp32, !i32) -> !fp32
     return %5 : !fp32
   }